@@ -7,9 +7,35 @@ Currently, this includes the log_node_details function for logging node informat
 
 import os
 import json
+import atexit
+import logging
+import queue
 import datetime
+import threading
+import time
+import yaml
 from typing import Dict, List, Any, Optional
 
+# Cached log timestamp: strftime goes through the C locale layer, so the
+# formatted string is reused until the wall clock ticks to the next second
+_last_ts_sec = 0
+_last_ts_str = ''
+
+
+def _fast_ts() -> str:
+    """
+    Return the current timestamp as 'YYYY-MM-DD HH:MM:SS', cached per second.
+
+    Returns:
+        Formatted timestamp string.
+    """
+    global _last_ts_sec, _last_ts_str
+    s = int(time.time())
+    if s != _last_ts_sec:
+        _last_ts_sec = s
+        _last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(s))
+    return _last_ts_str
+
 
 class FunctionImplementations:
     """
@@ -18,7 +44,10 @@ class FunctionImplementations:
     This class contains the actual Python logic for functions that the LLM can call,
     particularly the logging function that records node details in a Markdown file.
     """
-    
+
+    # Queued by _flush_and_close to tell the drain thread to exit
+    _LOG_SENTINEL = object()
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the FunctionImplementations object.
@@ -27,8 +56,83 @@ class FunctionImplementations:
             config: Dictionary containing configuration parameters.
         """
         self.config = config
+        self.logger = logging.getLogger('tota_core.function_implementations')
         self.log_file_path = self._generate_log_file_path()
-    
+
+        # Build the function-definition payloads once: both the JSON Schema
+        # form and the Anthropic tools form are immutable for the run
+        self._function_defs = self._build_function_definitions()
+        self._anthropic_tools = [{
+            "type": "custom",
+            "name": d["name"],
+            "description": d.get("description", ""),
+            "input_schema": d.get("parameters", {})
+        } for d in self._function_defs]
+
+        # Buffered log writer: log_node_details enqueues Markdown blocks and a
+        # background thread appends them, fsyncing every N items instead of on
+        # every node. Durability is preserved at run boundaries via atexit.
+        self._log_fh = None
+        self._logged = set()  # Per-run dedup of identical node log entries
+        self._log_q: "queue.Queue" = queue.Queue()
+        self._fsync_every = config.get("log_fsync_every", 32)
+        self._writes_since_fsync = 0
+        self._writer_failed = False
+        self._drain_thread = threading.Thread(target=self._drain, daemon=True)
+        self._drain_thread.start()
+        atexit.register(self._flush_and_close)
+
+    def _drain(self) -> None:
+        """
+        Drain the log queue in the background, appending entries to the log file.
+
+        The file handle is opened lazily (after initialize_log_file has written
+        the header) and fsync is issued at most every log_fsync_every entries.
+        Write failures are logged and mark the writer as failed so that
+        log_node_details falls back to synchronous writes; the loop keeps
+        consuming either way, so queue joins can never deadlock. The thread
+        exits when it dequeues the shutdown sentinel.
+        """
+        while True:
+            item = self._log_q.get()
+            try:
+                if item is self._LOG_SENTINEL:
+                    return
+                try:
+                    if self._log_fh is None:
+                        self._log_fh = open(self.log_file_path, 'a', buffering=1 << 16)
+                    self._log_fh.write(item)
+                    self._writes_since_fsync += 1
+                    if self._writes_since_fsync >= self._fsync_every:
+                        self._log_fh.flush()
+                        os.fsync(self._log_fh.fileno())
+                        self._writes_since_fsync = 0
+                except (OSError, ValueError) as e:
+                    self._writer_failed = True
+                    self.logger.error(f"Background log writer failed, entry dropped: {e}")
+            finally:
+                self._log_q.task_done()
+
+    def _flush_and_close(self) -> None:
+        """
+        Flush any queued log entries to disk and close the log file handle.
+
+        Registered with atexit so buffered entries are durable at shutdown.
+        The drain thread is stopped via a sentinel and a bounded join, so
+        shutdown cannot hang even if the writer is wedged.
+        """
+        if self._drain_thread.is_alive():
+            self._log_q.put(self._LOG_SENTINEL)
+            self._drain_thread.join(timeout=5.0)
+        if self._log_fh is not None:
+            try:
+                self._log_fh.flush()
+                os.fsync(self._log_fh.fileno())
+                self._log_fh.close()
+            except (OSError, ValueError) as e:
+                self.logger.error(f"Failed to flush log file on shutdown: {e}")
+            self._log_fh = None
+
     def _generate_log_file_path(self) -> str:
         """
         Generate a log file path using the template from config.
@@ -55,7 +159,7 @@ class FunctionImplementations:
             task_description: Description of the overall task.
             config_dict: Dictionary containing configuration parameters.
         """
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = _fast_ts()
         
         # Format the config dict for the log (removing sensitive info)
         if hasattr(config_dict, 'get_all'):
@@ -72,23 +176,36 @@ class FunctionImplementations:
         if 'llm_api_key' in safe_config:
             safe_config['llm_api_key'] = "***REDACTED***"
         
-        # Create log directory if it doesn't exist
-        log_dir = os.path.dirname(self.log_file_path)
-        os.makedirs(log_dir, exist_ok=True)
-        
-        # Write header information
-        with open(self.log_file_path, 'w') as f:
+        # New run: forget which nodes were already logged
+        self._logged.clear()
+
+        # Close any stale append handle so the writer thread reopens the
+        # freshly initialized file. The join is safe: the drain thread only
+        # exits via the shutdown sentinel, and it is skipped once stopped.
+        if self._drain_thread.is_alive():
+            self._log_q.join()
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+
+        # Write the header to a temp file and move it into place atomically,
+        # so being killed mid-write can't leave a torn log. The log directory
+        # already exists; _generate_log_file_path created it.
+        tmp_path = self.log_file_path + '.tmp'
+        with open(tmp_path, 'w') as f:
             f.write(f"# Tree-of-Thoughts Agent Run\n\n")
             f.write(f"**Timestamp:** {timestamp}\n\n")
             f.write(f"**Task:** {task_description}\n\n")
-            f.write(f"**Configuration:**\n")
-            for key, value in sorted(safe_config.items()):
-                f.write(f"- **{key}**: {value}\n")
-            f.write("\n## Thought Process\n\n")
-        
+            # Dump the config as a fenced YAML block: sorting and formatting
+            # happen in one library call, and nested values stay readable
+            f.write(f"**Configuration:**\n\n```yaml\n")
+            yaml.safe_dump(safe_config, f, sort_keys=True, default_flow_style=False)
+            f.write("```\n\n## Thought Process\n\n")
+
             # Ensure data is written to disk
             f.flush()
             os.fsync(f.fileno())
+        os.replace(tmp_path, self.log_file_path)
     
     def log_node_details(
         self,
@@ -106,13 +223,26 @@ class FunctionImplementations:
             generated_thoughts: List of thoughts with their evaluations.
             llm_decision: Decision made by the LLM.
         """
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Skip exact duplicates: retries and the fallback function-call path
+        # can re-log the same node, each duplicate costing I/O and cluttering
+        # the audit trail
+        key = (
+            node_id,
+            tuple(sorted(t.get("thought_id", "") for t in generated_thoughts)),
+            llm_decision.get("action_type")
+        )
+        if key in self._logged:
+            return
+        self._logged.add(key)
+
+        timestamp = _fast_ts()
         action_type = llm_decision.get("action_type", "Unknown")
         selected_thought_id = llm_decision.get("selected_thought_id")
         decision_rationale = llm_decision.get("decision_rationale", "")
         
-        # Start building the markdown content
-        content = f"""
+        # Assemble the markdown content as a list of parts joined once at the
+        # end, instead of repeated string concatenation
+        parts = [f"""
 ### Node: {node_id} ({timestamp})
 
 #### Sub-Problem
@@ -120,8 +250,8 @@ class FunctionImplementations:
 
 #### Generated Thoughts
 
-"""
-        
+"""]
+
         # Add each thought with its evaluation
         for thought in generated_thoughts:
             thought_id = thought.get("thought_id", "unknown-id")
@@ -129,43 +259,69 @@ class FunctionImplementations:
             generation_rationale = thought.get("generation_rationale", "")
             evaluation_score = thought.get("evaluation_score", 0.0)
             evaluation_justification = thought.get("evaluation_justification", "")
-            
-            content += f"""**Thought {thought_id}:** {description}
+
+            parts.append(f"""**Thought {thought_id}:** {description}
 - **Generation Rationale:** {generation_rationale}
 - **Evaluation Score:** {evaluation_score:.2f}
 - **Evaluation Justification:** {evaluation_justification}
 
-"""
-        
+""")
+
         # Add the decision
-        content += f"""#### Decision
+        parts.append(f"""#### Decision
 - **Action:** {action_type}
-"""
-        
+""")
+
         if selected_thought_id:
-            content += f"- **Selected Thought:** {selected_thought_id}\n"
-        
-        content += f"""- **Rationale:** {decision_rationale}
+            parts.append(f"- **Selected Thought:** {selected_thought_id}\n")
+
+        parts.append(f"""- **Rationale:** {decision_rationale}
 
 ---
 
-"""
-        
-        # Append to the log file
-        with open(self.log_file_path, 'a') as file:
-            file.write(content)
-            file.flush()
-            os.fsync(file.fileno())
+""")
+
+        content = ''.join(parts)
+
+        # Enqueue for the background writer thread; if it has failed or been
+        # shut down, write synchronously so I/O errors surface to the caller
+        # instead of entries being silently dropped
+        if self._writer_failed or not self._drain_thread.is_alive():
+            with open(self.log_file_path, 'a') as file:
+                file.write(content)
+        else:
+            self._log_q.put(content)
     
     def get_function_definitions(self) -> List[Dict[str, Any]]:
         """
         Get the JSON Schema definition of the log_node_details function.
-        
+
+        Returns:
+            List containing the function definition in JSON Schema format.
+        """
+        return self._function_defs
+
+    def get_anthropic_tools(self) -> List[Dict[str, Any]]:
+        """
+        Get the function definitions in Anthropic's tools format.
+
+        Returns:
+            List of tool entries with 'custom' type and input_schema.
+        """
+        return self._anthropic_tools
+
+    def _build_function_definitions(self) -> List[Dict[str, Any]]:
+        """
+        Build the JSON Schema definition of the log_node_details function.
+
+        Called once at construction; get_function_definitions returns the
+        cached result.
+
         Returns:
             List containing the function definition in JSON Schema format.
         """
         log_function_name = self.config.get("function_names", {}).get("log_node", "log_node_details")
-        
+
         return [{
             "name": log_function_name,
             "description": "Log details about a node in the thought tree, including its sub-problem, generated thoughts, and the LLM's decision.",
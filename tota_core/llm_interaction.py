@@ -8,226 +8,448 @@ This module handles all interactions with the LLM API, including:
 """
 
 import os
+import copy
 import json
 import time
+import asyncio
+import hashlib
 import logging
+import pathlib
+import random
+import httpx
 import requests
 from typing import Dict, List, Any, Optional
 
-# Import Anthropic client
-try:
-    from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+# The Anthropic client is a hard dependency: fail fast at import time
+# rather than per call
+from anthropic import (
+    Anthropic,
+    AsyncAnthropic,
+    APIConnectionError,
+    APITimeoutError,
+    RateLimitError,
+)
 
-# Import OpenAI client (optional)
+# Errors worth retrying: network issues, timeouts and rate limits
+TRANSIENT_ERRORS = (
+    requests.exceptions.RequestException,
+    TimeoutError,
+    APIConnectionError,
+    APITimeoutError,
+    RateLimitError,
+)
+
+# Import diskcache for the on-disk response cache (optional)
 try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
+    from diskcache import Cache
+    DISKCACHE_AVAILABLE = True
 except ImportError:
-    OPENAI_AVAILABLE = False
+    DISKCACHE_AVAILABLE = False
 
 
 class LLMInteraction:
     """Handles interactions with the LLM API."""
-    
+
     def __init__(self, config):
         """
         Initialize the LLM interaction module.
-        
+
         Args:
             config: Configuration dictionary or object
         """
         self.logger = logging.getLogger('tota_core.llm_interaction')
-        
+
         # Extract configuration parameters
         self.model = config.get('llm_model_identifier', 'claude-3-sonnet-20240229')
         self.api_base_url = config.get('llm_api_base_url', 'https://api.anthropic.com/v1')
         self.retry_attempts = config.get('llm_retry_attempts', 3)
-        
+
         # Get API key from environment variables or config (prefer env vars)
         self.api_key = os.environ.get('ANTHROPIC_API_KEY') or config.get('llm_api_key', '')
-        
-        # Initialize Anthropic client
-        if ANTHROPIC_AVAILABLE:
-            self.client = Anthropic(api_key=self.api_key)
+
+        # Initialize Anthropic clients (sync and async) over a shared pooled
+        # HTTP/2 transport, so TCP/TLS setup is amortized across calls and
+        # concurrent requests can multiplex one connection
+        limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        timeout = httpx.Timeout(60.0, connect=5.0)
+        self._http = httpx.Client(http2=True, limits=limits, timeout=timeout)
+        self._ahttp = httpx.AsyncClient(http2=True, limits=limits, timeout=timeout)
+        self.client = Anthropic(api_key=self.api_key, http_client=self._http)
+        self.aclient = AsyncAnthropic(api_key=self.api_key, http_client=self._ahttp)
+
+        # Cap concurrent async calls to respect API rate limits
+        self.max_concurrent_llm = config.get('max_concurrent_llm', 8)
+        self._semaphore = asyncio.Semaphore(self.max_concurrent_llm)
+
+        # Cache for the Anthropic tools form of the most recent function
+        # definitions (see _build_params)
+        self._last_function_defs: Optional[List[Dict[str, Any]]] = None
+        self._last_tools: Optional[List[Dict[str, Any]]] = None
+
+        # Prompt/response cache: in-memory dict plus optional on-disk cache.
+        # Tree search revisits structurally identical sub-problems, so cache
+        # hits skip whole API round-trips.
+        self.cache_enabled = config.get('llm_cache_enabled', True)
+        self._mem_cache: Dict[str, Dict[str, Any]] = {}
+        if DISKCACHE_AVAILABLE and self.cache_enabled:
+            self._disk_cache = Cache(config.get('cache_dir', '.tota_cache'))
         else:
-            self.logger.warning("Anthropic client not available. Install with: pip install anthropic")
-            self.client = None
-        
+            self._disk_cache = None
+
         # Template paths
         self.generation_prompt_template = config.get('generation_prompt_template')
         self.decision_hub_prompt_template = config.get('decision_hub_prompt_template')
-    
+
+        # Load templates once at construction; load_prompt_template memoizes
+        # per (path, mtime) so repeated callers never re-read unchanged files
+        self._template_cache: Dict[str, tuple] = {}
+        self._templates = self.load_prompts_from_config()
+
     def _format_prompt(self, template_content: str, **kwargs) -> str:
         """
         Format a prompt template with the provided variables.
-        
+
         Args:
             template_content: Template content to format
             **kwargs: Variables to format the template with
-            
+
         Returns:
             Formatted prompt
         """
-        return template_content.format(**kwargs)
-    
-    def call_llm(
+        return template_content.format_map(kwargs)
+
+    def _cache_key(
         self,
-        prompt_template_content: str,
-        system_prompt: str = "",
-        expect_function_call: bool = False,
-        function_definitions: Optional[List[Dict[str, Any]]] = None,
-        force_function_name: Optional[str] = None,
-        **kwargs
+        prompt: str,
+        system_prompt: str,
+        function_definitions: Optional[List[Dict[str, Any]]],
+        force_function_name: Optional[str]
+    ) -> str:
+        """
+        Compute a cache key for a fully-specified LLM request.
+
+        Args:
+            prompt: Fully formatted user prompt.
+            system_prompt: System prompt.
+            function_definitions: Function definitions sent with the request.
+            force_function_name: Forced function name, if any.
+
+        Returns:
+            Hex digest uniquely identifying the request.
+        """
+        payload = json.dumps({
+            'm': self.model,
+            's': system_prompt,
+            'p': prompt,
+            't': function_definitions,
+            'f': force_function_name
+        }, sort_keys=True)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response, checking memory first, then disk.
+
+        Args:
+            key: Cache key from _cache_key.
+
+        Returns:
+            Cached response dictionary (a fresh copy the caller may mutate
+            freely), or None on a miss.
+        """
+        result = self._mem_cache.get(key)
+        if result is None and self._disk_cache is not None:
+            result = self._disk_cache.get(key)
+            if result is not None:
+                # Promote to the in-memory cache for subsequent hits
+                self._mem_cache[key] = result
+        if result is None:
+            return None
+        # Hand out a copy so callers mutating the response can't corrupt
+        # the cached entry for later hits
+        return copy.deepcopy(result)
+
+    def _cache_put(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        Store a response in the in-memory and on-disk caches.
+
+        Args:
+            key: Cache key from _cache_key.
+            result: Parsed response dictionary to cache. A copy is stored, so
+                the caller's dict stays independent of the cache.
+        """
+        result = copy.deepcopy(result)
+        self._mem_cache[key] = result
+        if self._disk_cache is not None:
+            self._disk_cache[key] = result
+
+    @staticmethod
+    def _retry_wait(attempt: int, error: Exception) -> float:
+        """
+        Compute the delay before the next retry attempt.
+
+        Honors the API's Retry-After header when present; otherwise uses
+        full-jitter exponential backoff capped at 30 seconds, which avoids
+        thundering-herd retries under concurrent calls.
+
+        Args:
+            attempt: 1-based retry attempt number.
+            error: The exception that triggered the retry.
+
+        Returns:
+            Number of seconds to wait.
+        """
+        headers = getattr(getattr(error, 'response', None), 'headers', None)
+        if headers is not None:
+            retry_after = headers.get('retry-after')
+            if retry_after:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    pass
+        return random.uniform(0, min(2 ** attempt, 30))
+
+    def _build_params(
+        self,
+        prompt: str,
+        system_prompt: str,
+        expect_function_call: bool,
+        function_definitions: Optional[List[Dict[str, Any]]],
+        force_function_name: Optional[str]
     ) -> Dict[str, Any]:
         """
-        Call the LLM API with the provided prompt.
-        
+        Build the parameter dictionary for an Anthropic messages.create call.
+
         Args:
-            prompt_template_content: Template content for the prompt
-            system_prompt: System prompt (optional)
-            expect_function_call: Whether to expect a function call in the response
-            function_definitions: List of function definitions for the LLM
-            force_function_name: Force the LLM to use this function
-            **kwargs: Variables to format the prompt template with
-            
+            prompt: Fully formatted user prompt.
+            system_prompt: System prompt (optional).
+            expect_function_call: Whether to expect a function call in the response.
+            function_definitions: List of function definitions for the LLM.
+            force_function_name: Force the LLM to use this function.
+
         Returns:
-            Response from the LLM as a dictionary
+            Dictionary of keyword arguments for messages.create.
         """
-        # Format the prompt
-        prompt = self._format_prompt(prompt_template_content, **kwargs)
-        
         # Prepare messages
         messages = [
             {"role": "user", "content": prompt}
         ]
-        
+
         # Prepare API call parameters
         params = {
             "model": self.model,
             "max_tokens": 4000,
             "messages": messages
         }
-        
-        # Add system prompt if provided
+
+        # Add system prompt if provided, marked as a cacheable prefix so
+        # repeat calls within the cache window skip reprocessing it
         if system_prompt:
-            params["system"] = system_prompt
-        
+            params["system"] = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
+
         # Add function calling parameters if applicable
         if expect_function_call and function_definitions:
-            # Convert function definitions to Anthropic's expected format with 'custom' type
-            tools = []
-            for func_def in function_definitions:
-                tools.append({
-                    "type": "custom",
-                    "name": func_def["name"],
-                    "description": func_def.get("description", ""),
-                    "input_schema": func_def.get("parameters", {})
-                })
+            # Convert function definitions to Anthropic's expected format with
+            # 'custom' type. Callers pass the same definitions list on every
+            # call, so the converted form is cached keyed on object identity.
+            if function_definitions is self._last_function_defs:
+                tools = self._last_tools
+            else:
+                tools = []
+                for func_def in function_definitions:
+                    tools.append({
+                        "type": "custom",
+                        "name": func_def["name"],
+                        "description": func_def.get("description", ""),
+                        "input_schema": func_def.get("parameters", {})
+                    })
+                if tools:
+                    # Cache the static tool schema prefix along with the
+                    # system prompt
+                    tools[-1]["cache_control"] = {"type": "ephemeral"}
+                self._last_function_defs = function_definitions
+                self._last_tools = tools
             params["tools"] = tools
-            
+
             # Force tool choice if specified
             if force_function_name:
                 # Use the format from Anthropic API documentation: {"type": "tool", "name": "tool_name"}
                 params["tool_choice"] = {
-                    "type": "tool", 
+                    "type": "tool",
                     "name": force_function_name
                 }
-        
+
+        return params
+
+    def _parse_response(
+        self,
+        response: Any,
+        expect_function_call: bool,
+        force_function_name: Optional[str],
+        kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Parse an Anthropic API response into the ToTA response dictionary.
+
+        Args:
+            response: Raw response object from the Anthropic client.
+            expect_function_call: Whether to expect a function call in the response.
+            force_function_name: Function name that was forced, if any.
+            kwargs: Prompt template variables (used for fallback function calls).
+
+        Returns:
+            Response dictionary with a function call, a list of function
+            calls (when the model uses parallel tool use), or text content.
+        """
+        if expect_function_call:
+            # Collect every tool_use block: Anthropic's parallel tool use can
+            # return several calls in one message, so a single turn can carry
+            # evaluations for all sibling thoughts instead of one round-trip
+            # per call
+            calls = []
+            for content_item in response.content:
+                if getattr(content_item, 'type', None) == 'tool_use':
+                    # Parse arguments from JSON
+                    try:
+                        function_args = content_item.input if isinstance(content_item.input, dict) else json.loads(content_item.input)
+                    except json.JSONDecodeError:
+                        self.logger.error(f"Invalid JSON in function arguments: {content_item.input}")
+                        raise ValueError("Invalid JSON in function arguments")
+
+                    calls.append({
+                        "name": content_item.name,
+                        "arguments": function_args
+                    })
+
+            if len(calls) == 1:
+                # Single call keeps the established response shape
+                return {
+                    "type": "function_call",
+                    "name": calls[0]["name"],
+                    "arguments": calls[0]["arguments"]
+                }
+            if calls:
+                return {"type": "function_calls", "calls": calls}
+
+            # No tool use was found in the response. Collect the text content
+            # in a single pass; it serves both the warning and the fallback
+            text_response = ''.join(
+                item.text for item in response.content
+                if getattr(item, 'type', None) == 'text'
+            )
+            self.logger.warning("No function call found in response. Full response content: %s", text_response)
+
+            # If a specific function was forced, create a fallback function call
+            if force_function_name:
+                self.logger.warning(f"Creating fallback function call for {force_function_name}")
+
+                # Create a minimal fallback function call. It is marked
+                # degraded so the response cache never stores it: a single
+                # hiccup must not replay as a Backtrack for every future
+                # identical request.
+                return {
+                    "type": "function_call",
+                    "name": force_function_name,
+                    "degraded": True,
+                    "arguments": {
+                        "node_id": kwargs.get("node_id", "unknown"),
+                        "node_sub_problem": kwargs.get("current_sub_problem", "unknown"),
+                        "generated_thoughts": kwargs.get("thoughts", []),
+                        "llm_decision": {
+                            "action_type": "Backtrack",
+                            "decision_rationale": "Function calling failed, fallback to backtracking."
+                        }
+                    }
+                }
+            else:
+                raise ValueError("Expected function call in response, but none was found")
+
+        # Process text response
+        text_content = ''.join(
+            content_item.text for content_item in response.content
+            if getattr(content_item, 'type', None) == 'text'
+        )
+
+        return {"type": "text", "content": text_content}
+
+    def call_llm(
+        self,
+        prompt_template_content: str,
+        system_prompt: str = "",
+        expect_function_call: bool = False,
+        function_definitions: Optional[List[Dict[str, Any]]] = None,
+        force_function_name: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Call the LLM API with the provided prompt.
+
+        Args:
+            prompt_template_content: Template content for the prompt
+            system_prompt: System prompt (optional)
+            expect_function_call: Whether to expect a function call in the response
+            function_definitions: List of function definitions for the LLM
+            force_function_name: Force the LLM to use this function
+            **kwargs: Variables to format the prompt template with
+
+        Returns:
+            Response from the LLM as a dictionary
+        """
+        # Format the prompt
+        prompt = self._format_prompt(prompt_template_content, **kwargs)
+
+        # Check the response cache. Unforced function-call requests have a
+        # nondeterministic response shape, so those bypass the cache.
+        cacheable = self.cache_enabled and not (expect_function_call and not force_function_name)
+        if cacheable:
+            cache_key = self._cache_key(prompt, system_prompt, function_definitions, force_function_name)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                self.logger.info("Response cache hit, skipping LLM API call")
+                return cached
+
+        params = self._build_params(
+            prompt, system_prompt, expect_function_call,
+            function_definitions, force_function_name
+        )
+
         # Retry logic for transient errors
         for attempt in range(1, self.retry_attempts + 1):
             try:
                 self.logger.info(f"Calling LLM API (attempt {attempt}/{self.retry_attempts})")
-                
-                # Log the request for debugging
-                self.logger.debug(f"Request to Anthropic API: {json.dumps(params, indent=2)}")
-                
+
+                # Log the request for debugging; the JSON serialization is
+                # gated so it only runs when DEBUG is actually enabled
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Request to Anthropic API: %s", json.dumps(params))
+
                 # Make the API call using the client
                 response = self.client.messages.create(**params)
-                
-                # Log the raw response for debugging
-                self.logger.debug(f"Raw response from Anthropic API: {response}")
-                
+
+                # Log the raw response for debugging (lazy %s formatting, so
+                # the string is only built when the record is emitted)
+                self.logger.debug("Raw response from Anthropic API: %s", response)
+
                 # Parse the response
-                if expect_function_call:
-                    # Check for tool calls in response
-                    tool_use_found = False
-                    
-                    for content_item in response.content:
-                        if hasattr(content_item, 'type') and content_item.type == 'tool_use':
-                            # Extract function call details
-                            function_name = content_item.name
-                            
-                            # Parse arguments from JSON
-                            try:
-                                function_args = content_item.input if isinstance(content_item.input, dict) else json.loads(content_item.input)
-                            except json.JSONDecodeError:
-                                self.logger.error(f"Invalid JSON in function arguments: {content_item.input}")
-                                raise ValueError("Invalid JSON in function arguments")
-                            
-                            function_call = {
-                                "type": "function_call",
-                                "name": function_name,
-                                "arguments": function_args
-                            }
-                            tool_use_found = True
-                            return function_call
-                    
-                    # If no tool use was found in the response
-                    if not tool_use_found:
-                        # Generate fallback function call for debug purposes
-                        fallback_text = "No function call found in response. Full response content: "
-                        for item in response.content:
-                            if hasattr(item, 'type') and item.type == 'text':
-                                fallback_text += item.text
-                        
-                        self.logger.warning(fallback_text)
-                        
-                        # If a specific function was forced, create a fallback function call
-                        if force_function_name:
-                            self.logger.warning(f"Creating fallback function call for {force_function_name}")
-                            
-                            # Extract basic information from the text response
-                            text_response = ""
-                            for item in response.content:
-                                if hasattr(item, 'type') and item.type == 'text':
-                                    text_response += item.text
-                            
-                            # Create a minimal fallback function call
-                            return {
-                                "type": "function_call",
-                                "name": force_function_name,
-                                "arguments": {
-                                    "node_id": kwargs.get("node_id", "unknown"),
-                                    "node_sub_problem": kwargs.get("current_sub_problem", "unknown"),
-                                    "generated_thoughts": kwargs.get("thoughts", []),
-                                    "llm_decision": {
-                                        "action_type": "Backtrack",
-                                        "decision_rationale": "Function calling failed, fallback to backtracking."
-                                    }
-                                }
-                            }
-                        else:
-                            raise ValueError("Expected function call in response, but none was found")
-                        
-                # Process text response
-                text_content = ""
-                for content_item in response.content:
-                    if hasattr(content_item, 'type') and content_item.type == 'text':
-                        text_content += content_item.text
-                
-                return {"type": "text", "content": text_content}
-                
-            except (requests.exceptions.RequestException, TimeoutError) as e:
+                result = self._parse_response(response, expect_function_call, force_function_name, kwargs)
+                # Never cache degraded results such as the fallback
+                # function call
+                if cacheable and not result.get("degraded"):
+                    self._cache_put(cache_key, result)
+                return result
+
+            except TRANSIENT_ERRORS as e:
                 # Handle transient errors (network issues, timeouts, rate limits)
                 self.logger.warning(f"Transient error during LLM API call (attempt {attempt}/{self.retry_attempts}): {e}")
-                
+
                 if attempt < self.retry_attempts:
-                    # Exponential backoff: 2^attempt seconds (2, 4, 8, ...)
-                    wait_time = 2 ** attempt
-                    self.logger.info(f"Retrying in {wait_time} seconds...")
+                    # Retry-After when the API provides it, jittered backoff otherwise
+                    wait_time = self._retry_wait(attempt, e)
+                    self.logger.info(f"Retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
                 else:
                     # Last attempt failed, raise the error
@@ -237,50 +459,165 @@ class LLMInteraction:
                 # Handle other errors (authentication, invalid requests, etc.)
                 self.logger.error(f"Error during LLM API call: {e}")
                 raise Exception(f"API error: {e}")
-        
+
+        # This point should not be reached due to the raise in the loop
+        return {"type": "error", "content": "Unexpected error in LLM call"}
+
+    async def acall_llm(
+        self,
+        prompt_template_content: str,
+        system_prompt: str = "",
+        expect_function_call: bool = False,
+        function_definitions: Optional[List[Dict[str, Any]]] = None,
+        force_function_name: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Async variant of call_llm for concurrent sibling-thought expansion.
+
+        Callers can fan out per-thought generation/evaluation with
+        asyncio.gather; concurrency is capped by the max_concurrent_llm
+        semaphore to respect API rate limits.
+
+        Args:
+            prompt_template_content: Template content for the prompt
+            system_prompt: System prompt (optional)
+            expect_function_call: Whether to expect a function call in the response
+            function_definitions: List of function definitions for the LLM
+            force_function_name: Force the LLM to use this function
+            **kwargs: Variables to format the prompt template with
+
+        Returns:
+            Response from the LLM as a dictionary
+        """
+        # Format the prompt
+        prompt = self._format_prompt(prompt_template_content, **kwargs)
+
+        # Check the response cache. Unforced function-call requests have a
+        # nondeterministic response shape, so those bypass the cache.
+        cacheable = self.cache_enabled and not (expect_function_call and not force_function_name)
+        if cacheable:
+            cache_key = self._cache_key(prompt, system_prompt, function_definitions, force_function_name)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                self.logger.info("Response cache hit, skipping LLM API call")
+                return cached
+
+        params = self._build_params(
+            prompt, system_prompt, expect_function_call,
+            function_definitions, force_function_name
+        )
+
+        # Retry logic for transient errors
+        for attempt in range(1, self.retry_attempts + 1):
+            try:
+                self.logger.info(f"Calling LLM API async (attempt {attempt}/{self.retry_attempts})")
+
+                # Log the request for debugging; the JSON serialization is
+                # gated so it only runs when DEBUG is actually enabled
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Request to Anthropic API: %s", json.dumps(params))
+
+                # Make the API call using the async client, gated by the semaphore
+                async with self._semaphore:
+                    response = await self.aclient.messages.create(**params)
+
+                # Log the raw response for debugging (lazy %s formatting, so
+                # the string is only built when the record is emitted)
+                self.logger.debug("Raw response from Anthropic API: %s", response)
+
+                # Parse the response
+                result = self._parse_response(response, expect_function_call, force_function_name, kwargs)
+                # Never cache degraded results such as the fallback
+                # function call
+                if cacheable and not result.get("degraded"):
+                    self._cache_put(cache_key, result)
+                return result
+
+            except TRANSIENT_ERRORS as e:
+                # Handle transient errors (network issues, timeouts, rate limits)
+                self.logger.warning(f"Transient error during LLM API call (attempt {attempt}/{self.retry_attempts}): {e}")
+
+                if attempt < self.retry_attempts:
+                    # Retry-After when the API provides it, jittered backoff otherwise
+                    wait_time = self._retry_wait(attempt, e)
+                    self.logger.info(f"Retrying in {wait_time:.1f} seconds...")
+                    await asyncio.sleep(wait_time)
+                else:
+                    # Last attempt failed, raise the error
+                    self.logger.error(f"All retry attempts failed: {e}")
+                    raise Exception(f"API error: {e}")
+            except Exception as e:
+                # Handle other errors (authentication, invalid requests, etc.)
+                self.logger.error(f"Error during LLM API call: {e}")
+                raise Exception(f"API error: {e}")
+
         # This point should not be reached due to the raise in the loop
         return {"type": "error", "content": "Unexpected error in LLM call"}
-    
+
     def load_prompt_template(self, template_path: str) -> str:
         """
         Load a prompt template from a file.
-        
+
+        Results are memoized per (path, mtime), so repeated calls only touch
+        disk when the template file has changed.
+
         Args:
             template_path: Path to the prompt template file.
-            
+
         Returns:
             Content of the prompt template file as a string.
-            
+
         Raises:
             FileNotFoundError: If the template file doesn't exist.
         """
         try:
-            with open(template_path, 'r') as file:
-                return file.read()
+            mtime = os.path.getmtime(template_path)
+            cached = self._template_cache.get(template_path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            content = pathlib.Path(template_path).read_text(encoding='utf-8', errors='strict')
+            self._template_cache[template_path] = (mtime, content)
+            return content
         except FileNotFoundError:
             self.logger.error(f"Prompt template file not found: {template_path}")
             raise FileNotFoundError(f"Prompt template file not found: {template_path}")
-    
+
     def load_prompts_from_config(self) -> Dict[str, str]:
         """
         Load prompt templates specified in the configuration.
-        
+
         Returns:
             Dictionary mapping prompt names to template content.
-            
+
         Raises:
             FileNotFoundError: If any template file doesn't exist.
         """
         prompts = {}
-        
+
         # Load generation prompt template
         generation_path = self.generation_prompt_template
         if generation_path:
             prompts['generation'] = self.load_prompt_template(generation_path)
-        
+
         # Load decision hub prompt template
         decision_hub_path = self.decision_hub_prompt_template
         if decision_hub_path:
             prompts['decision_hub'] = self.load_prompt_template(decision_hub_path)
-        
+
         return prompts
+
+    def get_template(self, name: str) -> str:
+        """
+        Get a prompt template loaded at construction, without touching disk.
+
+        Args:
+            name: Template name ('generation' or 'decision_hub').
+
+        Returns:
+            Content of the prompt template.
+
+        Raises:
+            KeyError: If no template with that name was configured.
+        """
+        return self._templates[name]
@@ -26,5 +26,5 @@ def generate_id(prefix: str = "") -> str:
     Returns:
         Unique ID string
     """
-    unique_id = str(uuid.uuid4())[:8]  # Use first 8 chars of UUID
+    unique_id = uuid.uuid4().hex[:8]  # First 8 hex chars, no str()/hyphen overhead
     return f"{prefix}-{unique_id}" if prefix else unique_id
@@ -5,76 +5,80 @@ Parsing utilities for extracting structured data from LLM responses.
 import re
 from typing import Dict, List, Any, Optional
 
+# Precompiled patterns: the parser runs once per LLM text response, so the
+# regexes are compiled once at import instead of on every call.
+# The thought pattern is a single alternation covering both supported formats
+# ("1. description" numbered lists and "Thought 1: description"), so one
+# finditer pass collects every thought in document order.
+_THOUGHT_RE = re.compile(
+    r'(?:^|\n)'
+    r'(?:(?P<num>\d+)[.:]\s+(?P<body>.*?)(?=\n*(?:\d+[.:]|\Z))'  # Numbered lists
+    r'|Thought[ \t]+(?P<tnum>\d+)[.:][ \t]+(?P<tbody>.*?)(?=\n*(?:Thought[ \t]+\d+[.:]|\Z)))',  # "Thought N:" format
+    re.DOTALL
+)
+_RATIONALE_PATTERNS = [
+    re.compile(r'\*\*Rationale\*\*:\s*(.*?)(?=\n\n|\Z)', re.DOTALL),
+    re.compile(r'Rationale:\s*(.*?)(?=\n\n|\Z)', re.DOTALL)
+]
+
+# Per-tag compiled pattern cache for extract_xml
+_XML_CACHE: Dict[str, re.Pattern] = {}
+
 def extract_xml(text: str, tag: str) -> Optional[str]:
     """
     Extract content between XML-like tags from text.
-    
+
     Args:
         text: Text to search in
         tag: Tag name to extract
-        
+
     Returns:
         Content between tags, or None if not found
     """
-    pattern = f"<{tag}>(.*?)</{tag}>"
-    match = re.search(pattern, text, re.DOTALL)
+    pattern = _XML_CACHE.setdefault(tag, re.compile(f"<{tag}>(.*?)</{tag}>", re.DOTALL))
+    match = pattern.search(text)
     return match.group(1).strip() if match else None
 
 def extract_thoughts(content: str, node_id: str) -> List[Dict[str, Any]]:
     """
     Extract thoughts from LLM text output.
-    
+
     Args:
         content: LLM response text
         node_id: Current node ID (for thought ID generation)
-        
+
     Returns:
         List of thought dictionaries
     """
     thoughts = []
-    
-    # Look for patterns like "1. Thought description" or "Thought 1: description"
-    thought_patterns = [
-        r'(?:^|\n)(\d+)[.:]\s+(.*?)(?=\n*(?:\d+[.:]|\Z))',  # Numbered lists
-        r'(?:^|\n)Thought[ \t]+(\d+)[.:][ \t]+(.*?)(?=\n*(?:Thought[ \t]+\d+[.:]|\Z))'  # "Thought N:" format
-    ]
-    
-    for pattern in thought_patterns:
-        matches = re.findall(pattern, content, re.DOTALL)
-        if matches:
-            for idx, match in enumerate(matches):
-                thought_num = int(match[0])
-                full_text = match[1].strip()
-                
-                # Extract thought description and rationale
-                thought_desc = full_text
-                rationale = ""
-                
-                # Look for rationale sections
-                rationale_patterns = [
-                    r'\*\*Rationale\*\*:\s*(.*?)(?=\n\n|\Z)',
-                    r'Rationale:\s*(.*?)(?=\n\n|\Z)'
-                ]
-                
-                for r_pattern in rationale_patterns:
-                    r_match = re.search(r_pattern, full_text, re.DOTALL)
-                    if r_match:
-                        # Extract main thought (everything before rationale)
-                        thought_parts = re.split(r_pattern, full_text, maxsplit=1)
-                        if thought_parts and len(thought_parts) > 0:
-                            thought_desc = thought_parts[0].strip()
-                        rationale = r_match.group(1).strip()
-                        break
-                
-                # Clean up thought description
-                thought_desc = re.sub(r'^\*\*Thought\*\*:\s*', '', thought_desc)
-                thought_desc = thought_desc.strip()
-                
-                thought_id = f"{node_id}-t{thought_num}"
-                thoughts.append({
-                    "thought_id": thought_id,
-                    "description": thought_desc,
-                    "generation_rationale": rationale
-                })
-    
+
+    # Single pass over the response: one finditer covers both thought formats
+    for match in _THOUGHT_RE.finditer(content):
+        thought_num = int(match.group('num') or match.group('tnum'))
+        full_text = (match.group('body') if match.group('num') else match.group('tbody')).strip()
+
+        # Extract thought description and rationale
+        thought_desc = full_text
+        rationale = ""
+
+        # Look for rationale sections; everything before the rationale is the
+        # thought description, sliced directly instead of re-splitting
+        for r_pattern in _RATIONALE_PATTERNS:
+            r_match = r_pattern.search(full_text)
+            if r_match:
+                thought_desc = full_text[:r_match.start()].strip()
+                rationale = r_match.group(1).strip()
+                break
+
+        # Clean up thought description
+        if thought_desc.startswith('**Thought**:'):
+            thought_desc = thought_desc[len('**Thought**:'):].lstrip()
+
+        thought_id = f"{node_id}-t{thought_num}"
+        thoughts.append({
+            "thought_id": thought_id,
+            "description": thought_desc,
+            "generation_rationale": rationale
+        })
+
     return thoughts